@@ -12,52 +12,116 @@ This tool checks:
 
 import json
 import os
+import re
 import subprocess
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 
+import google.auth
+import google.auth.exceptions
+import requests
+from google.auth.transport.requests import AuthorizedSession
+
+# orjson is faster when installed; both parsers signal bad input (invalid JSON or UTF-8) with ValueError
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+# Shared pool for gcloud subprocesses, so independent checks overlap their startup time
+_executor = ThreadPoolExecutor(max_workers=4)
+
+# Regional locations look like us-central1 or asia-southeast1
+_REGION_RE = re.compile(r'^[a-z]+-[a-z]+\d+$')
+# Multi-region locations that don't follow the regional naming scheme
+_KNOWN_REGIONS = frozenset({'global', 'us', 'eu'})
+
+# ADC files are a few KiB; anything bigger is not a credentials file
+ADC_MAX_BYTES = 1 << 20
+
+
+# Only emit ANSI color codes to a terminal, and honor https://no-color.org
+_USE_COLOR = sys.stdout.isatty() and not os.environ.get('NO_COLOR')
+
 
 class Colors:
-    """ANSI color codes for terminal output."""
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    BLUE = '\033[94m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
+    """ANSI color codes for terminal output (empty strings when color is off)."""
+    GREEN = '\033[92m' if _USE_COLOR else ''
+    YELLOW = '\033[93m' if _USE_COLOR else ''
+    RED = '\033[91m' if _USE_COLOR else ''
+    BLUE = '\033[94m' if _USE_COLOR else ''
+    BOLD = '\033[1m' if _USE_COLOR else ''
+    END = '\033[0m' if _USE_COLOR else ''
 
 
 def print_success(message: str):
     """Print a success message in green."""
-    print(f"{Colors.GREEN}✓{Colors.END} {message}")
+    sys.stdout.write(f"{Colors.GREEN}✓{Colors.END} {message}\n")
 
 
 def print_warning(message: str):
     """Print a warning message in yellow."""
-    print(f"{Colors.YELLOW}⚠{Colors.END} {message}")
+    sys.stdout.write(f"{Colors.YELLOW}⚠{Colors.END} {message}\n")
 
 
 def print_error(message: str):
     """Print an error message in red."""
-    print(f"{Colors.RED}✗{Colors.END} {message}")
+    sys.stdout.write(f"{Colors.RED}✗{Colors.END} {message}\n")
 
 
 def print_info(message: str):
     """Print an info message in blue."""
-    print(f"{Colors.BLUE}ℹ{Colors.END} {message}")
+    sys.stdout.write(f"{Colors.BLUE}ℹ{Colors.END} {message}\n")
 
 
-def check_gcloud_installed() -> bool:
-    """Check if gcloud SDK is installed."""
+def run_gcloud(*args: str) -> Future:
+    """
+    Run a gcloud command in the background.
+
+    Returns:
+        Future resolving to the CompletedProcess. Raises FileNotFoundError
+        on .result() if gcloud is not installed.
+    """
+    return _executor.submit(
+        subprocess.run,
+        ['gcloud', *args],
+        capture_output=True,
+        text=True,
+        check=False
+    )
+
+
+def read_gcloud_config() -> dict:
+    """Read the active gcloud configuration as a dict of sections, e.g. {'core': {'project': ...}}."""
     try:
         result = subprocess.run(
-            ['gcloud', '--version'],
+            ['gcloud', 'config', 'list', '--format=json'],
             capture_output=True,
             text=True,
             check=False
         )
+        if result.returncode == 0:
+            return json.loads(result.stdout)
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    return {}
+
+
+@lru_cache(maxsize=1)
+def gcloud_config() -> Future:
+    """Start reading the gcloud configuration; later calls share the same result."""
+    return _executor.submit(read_gcloud_config)
+
+
+def check_gcloud_installed(pending: Optional[Future] = None) -> bool:
+    """Check if gcloud SDK is installed."""
+    try:
+        result = (pending or run_gcloud('--version')).result()
         if result.returncode == 0:
             version = result.stdout.split('\n')[0]
             print_success(f"gcloud SDK is installed: {version}")
@@ -71,24 +135,24 @@ def check_gcloud_installed() -> bool:
         return False
 
 
-def get_adc_path() -> Optional[Path]:
-    """Get the path to Application Default Credentials."""
+@lru_cache(maxsize=1)
+def get_adc_path() -> Path:
+    """
+    Get the path where Application Default Credentials are expected.
+
+    The default location is not checked for existence here; callers should
+    simply try to open it.
+    """
     # Check GOOGLE_APPLICATION_CREDENTIALS environment variable first
     if 'GOOGLE_APPLICATION_CREDENTIALS' in os.environ:
         path = Path(os.environ['GOOGLE_APPLICATION_CREDENTIALS'])
         if path.exists():
             return path
 
-    # Check default ADC location
+    # Fall back to the default ADC location
     if sys.platform == 'win32':
-        default_path = Path(os.environ.get('APPDATA', '')) / 'gcloud' / 'application_default_credentials.json'
-    else:
-        default_path = Path.home() / '.config' / 'gcloud' / 'application_default_credentials.json'
-
-    if default_path.exists():
-        return default_path
-
-    return None
+        return Path(os.environ.get('APPDATA', '')) / 'gcloud' / 'application_default_credentials.json'
+    return Path.home() / '.config' / 'gcloud' / 'application_default_credentials.json'
 
 
 def check_credential_expiry(creds: dict) -> Tuple[bool, Optional[str]]:
@@ -130,19 +194,28 @@ def check_adc() -> Tuple[bool, Optional[str]]:
     """
     adc_path = get_adc_path()
 
-    if not adc_path:
-        print_error("Application Default Credentials not found")
-        print_info("Run one of the following commands:")
-        print_info("  For user credentials: gcloud auth application-default login")
-        print_info("  For service account: export GOOGLE_APPLICATION_CREDENTIALS=/path/to/key.json")
-        return False, None
-
-    print_success(f"Found Application Default Credentials at: {adc_path}")
-
-    # Read and validate credentials
+    # Read and validate credentials; opening the file doubles as the existence check
     try:
-        with open(adc_path, 'r') as f:
-            creds = json.load(f)
+        with open(adc_path, 'rb') as f:
+            print_success(f"Found Application Default Credentials at: {adc_path}")
+            data = f.read(ADC_MAX_BYTES + 1)
+
+        # A corrupt credentials file breaks every later step, so stop here
+        problem = None
+        if len(data) > ADC_MAX_BYTES:
+            problem = f"Credentials file is larger than {ADC_MAX_BYTES >> 20} MiB"
+        else:
+            try:
+                creds = json_loads(data)
+            except ValueError:
+                problem = "Credentials file is not valid JSON"
+            else:
+                if not isinstance(creds, dict):
+                    problem = "Credentials file does not contain a JSON object"
+        if problem:
+            print_error(f"{problem}: {adc_path}")
+            print_info("Regenerate it with: gcloud auth application-default login")
+            raise SystemExit(2)
 
         is_valid, cred_type = check_credential_expiry(creds)
 
@@ -163,27 +236,20 @@ def check_adc() -> Tuple[bool, Optional[str]]:
 
         return True, cred_type
 
-    except (json.JSONDecodeError, IOError) as e:
+    except FileNotFoundError:
+        print_error("Application Default Credentials not found")
+        print_info("Run one of the following commands:")
+        print_info("  For user credentials: gcloud auth application-default login")
+        print_info("  For service account: export GOOGLE_APPLICATION_CREDENTIALS=/path/to/key.json")
+        return False, None
+    except IOError as e:
         print_error(f"Error reading credentials: {e}")
         return False, None
 
 
 def get_current_project() -> Optional[str]:
     """Get the current gcloud project."""
-    try:
-        result = subprocess.run(
-            ['gcloud', 'config', 'get-value', 'project'],
-            capture_output=True,
-            text=True,
-            check=False
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            project = result.stdout.strip()
-            if project and project != '(unset)':
-                return project
-    except FileNotFoundError:
-        pass
-    return None
+    return gcloud_config().result().get('core', {}).get('project') or None
 
 
 def set_project_env_var(project: str) -> bool:
@@ -218,6 +284,12 @@ def get_region() -> Optional[str]:
         print_success(f"Using region from environment: {region}")
         return region
 
+    # Check gcloud config
+    region = gcloud_config().result().get('compute', {}).get('region')
+    if region:
+        print_success(f"Using region from gcloud config: {region}")
+        return region
+
     # Prompt user for region
     print_info("\nNo region configured.")
     # Prompt user
@@ -230,10 +302,14 @@ def get_region() -> Optional[str]:
     print_info("  asia-southeast1 (Singapore)")
     print_info("\nFor the full list, see: https://cloud.google.com/vertex-ai/docs/general/locations")
 
-    region = input("Enter your preferred Google Cloud region (e.g., us-central1): ").strip()
-    if not region:
-        print_error("No region provided")
-        return None
+    while True:
+        region = input("Enter your preferred Google Cloud region (e.g., us-central1): ").strip()
+        if not region:
+            print_error("No region provided")
+            return None
+        if region in _KNOWN_REGIONS or _REGION_RE.match(region):
+            break
+        print_warning(f"'{region}' doesn't look like a Vertex AI region (e.g., us-central1 or global)")
     # Instructions to set the environment variable
     print_info(f"\nTo set the region for this session, run:")
     print_info(f"  export GOOGLE_CLOUD_REGION={region}")
@@ -241,24 +317,32 @@ def get_region() -> Optional[str]:
     return False
 
 
+def get_vertex_api_status(project: str) -> requests.Response:
+    """Fetch the Vertex AI service status from the Service Usage API using ADC."""
+    credentials, _ = google.auth.default(
+        scopes=['https://www.googleapis.com/auth/cloud-platform'],
+        quota_project_id=project
+    )
+    session = AuthorizedSession(credentials)
+    return session.get(
+        f'https://serviceusage.googleapis.com/v1/projects/{project}/services/aiplatform.googleapis.com',
+        timeout=30
+    )
+
+
+@lru_cache(maxsize=None)
+def start_vertex_api_check(project: str) -> Future:
+    """Start checking the Vertex AI API status in the background; cached per project."""
+    return _executor.submit(get_vertex_api_status, project)
+
+
 def check_vertex_api_enabled(project: str) -> bool:
     """Check if Vertex AI API is enabled for the project."""
     try:
-        result = subprocess.run(
-            [
-                'gcloud', 'services', 'list',
-                '--enabled',
-                '--filter=name:aiplatform.googleapis.com',
-                '--format=value(name)',
-                f'--project={project}'
-            ],
-            capture_output=True,
-            text=True,
-            check=False
-        )
+        response = start_vertex_api_check(project).result()
 
-        if result.returncode == 0:
-            if 'aiplatform.googleapis.com' in result.stdout:
+        if response.ok:
+            if response.json().get('state') == 'ENABLED':
                 print_success("Vertex AI API is enabled")
                 return True
             else:
@@ -270,21 +354,34 @@ def check_vertex_api_enabled(project: str) -> bool:
         else:
             # May not have permission to check
             print_warning("Could not verify if Vertex AI API is enabled")
-            print_info(f"Error: {result.stderr.strip()}")
+            print_info(f"Error: {response.status_code} {response.reason}")
             print_info("You may not have permission to list services, or the API might not be enabled")
             return False
 
-    except FileNotFoundError:
-        print_warning("Could not check Vertex AI API status (gcloud not available)")
+    except (google.auth.exceptions.GoogleAuthError, requests.RequestException, ValueError) as e:
+        print_warning("Could not check Vertex AI API status")
+        print_info(f"Error: {e}")
         return False
 
 
 def main():
     """Main function to run all validation checks."""
+    try:
+        return run_checks()
+    finally:
+        sys.stdout.flush()
+
+
+def run_checks():
+    """Run the validation checks in order, returning the process exit code."""
     print(f"\n{Colors.BOLD}Google Cloud Vertex AI Setup Validator{Colors.END}\n")
 
+    # Independent gcloud calls run concurrently; each is only awaited when needed
+    gcloud_version = run_gcloud('--version')
+    gcloud_config()
+
     # Step 1: Check gcloud SDK
-    if not check_gcloud_installed():
+    if not check_gcloud_installed(gcloud_version):
         print_error("\n❌ Setup incomplete: gcloud SDK not found")
         return 1
 
@@ -306,6 +403,9 @@ def main():
         print_error("\n❌ Setup incomplete: No project configured")
         return 1
 
+    # The API check needs only the project, so start it before prompting the user
+    start_vertex_api_check(project)
+
     print_success(f"Active gcloud project: {project}")
     if not set_project_env_var(project):
         print_error("\n❌ Setup incomplete: Set project environment variable")
@@ -19,6 +19,9 @@ python script.py 'tests/**/*.yaml' 'fixtures/*.yaml'
 
 # Specific directory
 python script.py 'cassettes/*.yaml'
+
+# Save all changes without prompting, using 4 worker processes
+python script.py --yes --jobs 4 'tests/**/*.yaml'
 ```
 
 **Features:**
@@ -26,6 +29,7 @@ python script.py 'cassettes/*.yaml'
 - ✅ Decompresses them and replaces with plain text
 - ✅ Shows a unified diff for each file
 - ✅ Interactive prompt (y/n/q) for each file
+- ✅ Non-interactive `--yes` mode that processes files in parallel
 - ✅ Processes multiple files in one command
 - ✅ Preserves YAML structure
 
@@ -38,39 +42,146 @@ python script.py 'cassettes/*.yaml'
 """
 
 import sys
-import gzip
+import argparse
 import base64
+import fnmatch
 import glob
-from pathlib import Path
+import os
+import re
 import yaml
+from concurrent.futures import ProcessPoolExecutor
+
+# Prefer ISA-L's SIMD-accelerated inflate (`pip install isal`) when it is installed
+try:
+    from isal.igzip import decompress as gzip_decompress
+except ImportError:
+    from gzip import decompress as gzip_decompress
+
+# Prefer the LibYAML C bindings, which are much faster on large cassettes
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+
+GZIP_MAGIC = b'\x1f\x8b'
 
 
 def decompress_gzip_string(compressed_data):
-    """Decompress gzip-compressed data (base64 encoded binary)."""
+    """Decompress gzip-compressed data (raw bytes, already base64-decoded)."""
+    # Cheap check for the gzip header before attempting to inflate
+    if compressed_data[:2] != GZIP_MAGIC:
+        return None
     try:
         # Decompress gzip
-        decompressed = gzip.decompress(compressed_data).decode('utf-8')
+        decompressed = gzip_decompress(compressed_data).decode('utf-8')
         return decompressed
     except Exception as e:
         print(f"Error decompressing: {e}")
         return None
 
 
-def process_yaml_file(file_path):
-    """Process a single YAML file and decompress gzip bodies."""
-    with open(file_path, 'r') as f:
-        content = f.read()
-    
-    original_content = content
-    
-    # Load YAML
+# A `string: !!binary |` body followed by its indented base64 lines
+BINARY_BODY_RE = re.compile(rb'^( +)string: !!binary \|\n((?:\1 +[A-Za-z0-9+/=]+\n)+)', re.MULTILINE)
+CONTENT_ENCODING_RE = re.compile(rb'^ +Content-Encoding:\n +- gzip\n', re.MULTILINE)
+
+
+# Bodies sent to a worker per task; below two chunks a pool only adds IPC overhead
+DECOMPRESS_CHUNKSIZE = 8
+
+
+def decompress_all(payloads, jobs=1):
+    """
+    Decompress a batch of payloads.
+
+    A process pool of up to `jobs` workers (None for the CPU count) is only
+    started when the batch splits into at least two chunks.
+    """
+    if jobs == 1 or len(payloads) <= DECOMPRESS_CHUNKSIZE:
+        return [decompress_gzip_string(payload) for payload in payloads]
+    chunks = -(-len(payloads) // DECOMPRESS_CHUNKSIZE)
+    workers = min(jobs or os.cpu_count() or 1, chunks)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(decompress_gzip_string, payloads, chunksize=DECOMPRESS_CHUNKSIZE))
+
+
+def decompress_binary_blocks(raw, file_path, jobs=1):
+    """
+    Decompress !!binary bodies by rewriting the raw cassette text, without a YAML round-trip.
+
+    Each decoded body is spliced back in as a YAML scalar and the matching
+    Content-Encoding header of the same response is removed. This relies on
+    the layout VCR writes: sorted keys (so a response's body comes before its
+    headers), a block-style `Content-Encoding:` / `- gzip` header entry, and
+    interactions starting with `- request:`.
+
+    Returns:
+        The new file content, or None if any body does not fit that layout
+        (or nothing was decompressed), so the caller can fall back to the
+        full YAML round-trip.
+    """
+    matches = list(BINARY_BODY_RE.finditer(raw))
+    if not matches or len(matches) != raw.count(b'string: !!binary'):
+        return None
+
+    # Find every gzip body's header before inflating anything, so a layout
+    # mismatch falls back to the YAML route without decompressing twice
+    targets = []
+    for match in matches:
+        payload = base64.b64decode(b''.join(match.group(2).split()))
+        if payload[:2] != GZIP_MAGIC:
+            continue
+
+        # VCR writes response headers after the body, before the next interaction
+        next_interaction = raw.find(b'\n- request:', match.end())
+        header = CONTENT_ENCODING_RE.search(
+            raw, match.end(), len(raw) if next_interaction == -1 else next_interaction
+        )
+        if not header:
+            return None
+        targets.append((match, header, payload))
+
+    payloads = [payload for _, _, payload in targets]
+    splices = []
+    for (match, header, _), decompressed in zip(targets, decompress_all(payloads, jobs)):
+        if decompressed:
+            splices.append((match, header, decompressed))
+
+    if not splices:
+        return None
+
+    pieces = []
+    pos = 0
+    for match, header, decompressed in splices:
+        indent = match.group(1)
+        scalar = yaml.dump({'string': decompressed}, Dumper=SafeDumper, allow_unicode=True, sort_keys=False)
+        pieces.append(raw[pos:match.start()])
+        pieces.extend(
+            indent + line if line.strip() else line
+            for line in scalar.encode('utf-8').splitlines(keepends=True)
+        )
+        pieces.append(raw[match.end():header.start()])
+        pos = header.end()
+        print(f"✓ Decompressed response body in {file_path}")
+    pieces.append(raw[pos:])
+    return b''.join(pieces).decode('utf-8')
+
+
+def decompress_yaml_bodies(raw, file_path, jobs=1):
+    """
+    Decompress !!binary bodies by loading and re-dumping the whole cassette.
+
+    Returns:
+        The new file content, or None if nothing was decompressed.
+    """
     try:
-        data = yaml.safe_load(content)
+        data = yaml.load(raw, Loader=SafeLoader)
     except Exception as e:
         print(f"Error parsing YAML: {e}")
-        return False
+        return None
     
-    modified = False
+    # Collect the binary bodies first so they can be decompressed as one batch
+    targets = []
     
     # Process interactions
     if isinstance(data, dict) and 'interactions' in data:
@@ -85,21 +196,54 @@ def process_yaml_file(file_path):
                     
                     # Check if it looks like base64 binary (!!binary marker)
                     if isinstance(string_val, bytes): # and string_val.startswith('!!'):
-
-                        # Try to decompress
-                        decompressed = decompress_gzip_string(string_val.strip())
-                        if decompressed:
-                            body['string'] = decompressed
-                            interaction['response']['headers'].pop('Content-Encoding') # Otherwise the receiver will try to decompress
-                            modified = True
-                            print(f"✓ Decompressed response body in {file_path}")
+                        targets.append((interaction, body))
+    
+    modified = False
+    payloads = [body['string'].strip() for _, body in targets]
+    
+    # Try to decompress
+    for (interaction, body), decompressed in zip(targets, decompress_all(payloads, jobs)):
+        if decompressed:
+            body['string'] = decompressed
+            interaction['response']['headers'].pop('Content-Encoding') # Otherwise the receiver will try to decompress
+            modified = True
+            print(f"✓ Decompressed response body in {file_path}")
     
     if not modified:
+        return None
+    
+    return yaml.dump(data, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
+
+
+def process_yaml_file(file_path, assume_yes=False, jobs=1):
+    """
+    Process a single YAML file and decompress gzip bodies.
+
+    With assume_yes, changes are saved straight away without showing a diff
+    or prompting. `jobs` is passed on to decompress_all for the file's bodies.
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    
+    # Only gzip-encoded responses stored as !!binary need work; skip parsing otherwise
+    if b'Content-Encoding' not in raw or b'!!binary' not in raw:
         print(f"No gzip bodies found in {file_path}")
         return False
     
-    # Generate new YAML
-    new_content = yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    # Rewrite the raw text directly, falling back to a full YAML round-trip for unusual layouts
+    new_content = decompress_binary_blocks(raw, file_path, jobs)
+    if new_content is None:
+        new_content = decompress_yaml_bodies(raw, file_path, jobs)
+    
+    if new_content is None:
+        print(f"No gzip bodies found in {file_path}")
+        return False
+    
+    if assume_yes:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+        print(f"✓ Saved {file_path}")
+        return True
     
     # Show diff
     print(f"\n{'='*80}")
@@ -108,21 +252,21 @@ def process_yaml_file(file_path):
     
     import difflib
     diff = difflib.unified_diff(
-        original_content.splitlines(keepends=True),
+        raw.decode('utf-8').splitlines(keepends=True),
         new_content.splitlines(keepends=True),
         fromfile=f"{file_path} (original)",
         tofile=f"{file_path} (decompressed)",
         lineterm=''
     )
     
-    diff_text = ''.join(diff)
-    print(diff_text)
+    sys.stdout.writelines(diff)
+    print()
     
     # Ask user
     while True:
         response = input("\n[y]es / [n]o / [q]uit? ").strip().lower()
         if response in ['y', 'yes']:
-            with open(file_path, 'w') as f:
+            with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(new_content)
             print(f"✓ Saved {file_path}")
             return True
@@ -134,28 +278,115 @@ def process_yaml_file(file_path):
             sys.exit(0)
 
 
+def scan_files(root, name_pattern):
+    """
+    Recursively yield files under root whose names match name_pattern.
+
+    Uses os.scandir so file/directory checks come from the cached d_type
+    rather than an extra stat per entry; only symlinks are stat'ed. Like glob,
+    hidden directories are never entered, hidden files only match a pattern
+    that starts with a dot, and symlinked files and directories are followed.
+    Unlike glob, a symlinked directory whose target was already visited
+    through another link is skipped, so link cycles terminate.
+    """
+    seen_links = set()
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory or '.')
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                hidden = entry.name.startswith('.')
+                path = os.path.join(directory, entry.name)
+                if entry.is_dir():
+                    if hidden:
+                        continue
+                    if entry.is_symlink():
+                        target = os.path.realpath(path)
+                        if target in seen_links:
+                            continue
+                        seen_links.add(target)
+                    stack.append(path)
+                elif (
+                    entry.is_file()
+                    and (not hidden or name_pattern.startswith('.'))
+                    and fnmatch.fnmatchcase(entry.name, name_pattern)
+                ):
+                    yield path
+
+
+def expand_pattern(pattern):
+    """Expand a single glob pattern, scanning directly for the common 'dir/**/name' form."""
+    head, sep, tail = pattern.partition('**')
+    name_pattern = tail[1:]
+    if (
+        sep
+        and (head == '' or head.endswith('/'))
+        and not glob.has_magic(head)
+        and tail.startswith('/')
+        and name_pattern
+        and '/' not in name_pattern
+        and '**' not in name_pattern
+    ):
+        return list(scan_files(head.rstrip('/') or head, name_pattern))
+    return glob.glob(pattern, recursive=True)
+
+
 def expand_glob_patterns(patterns):
     """Expand glob patterns and return list of unique file paths."""
     files = set()
     for pattern in patterns:
-        expanded = glob.glob(pattern, recursive=True)
+        expanded = expand_pattern(pattern)
         if not expanded:
             print(f"⚠ No files matched: {pattern}")
         files.update(expanded)
     return sorted(files)
 
 
+def process_one(file_path):
+    """Process a file non-interactively; runs in a worker process for --yes."""
+    try:
+        return file_path, process_yaml_file(file_path, assume_yes=True)
+    except FileNotFoundError:
+        print(f"✗ File not found: {file_path}")
+    except Exception as e:
+        print(f"✗ Error processing {file_path}: {e}")
+    return file_path, False
+
+
+def positive_int(value):
+    """argparse type for options that need a whole number of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python script.py <pattern> [<pattern> ...]")
-        print("Examples:")
-        print("  python script.py file.yaml")
-        print("  python script.py '*.yaml'")
-        print("  python script.py 'tests/**/*.yaml'")
-        print("  python script.py 'cassettes/*.yaml' 'fixtures/*.yaml'")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Decompress gzip-compressed body strings in YAML cassette files.",
+        epilog=(
+            "examples:\n"
+            "  python script.py file.yaml\n"
+            "  python script.py '*.yaml'\n"
+            "  python script.py 'tests/**/*.yaml'\n"
+            "  python script.py 'cassettes/*.yaml' 'fixtures/*.yaml'\n"
+            "  python script.py --yes --jobs 4 'tests/**/*.yaml'"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('patterns', nargs='+', metavar='pattern', help="file path or glob pattern")
+    parser.add_argument('-y', '--yes', action='store_true', help="save changes without showing diffs or prompting")
+    parser.add_argument('-j', '--jobs', type=positive_int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
     
-    file_paths = expand_glob_patterns(sys.argv[1:])
+    file_paths = expand_glob_patterns(args.patterns)
     
     if not file_paths:
         print("✗ No files found matching the provided patterns")
@@ -163,25 +394,32 @@ def main():
     
     print(f"Found {len(file_paths)} file(s) to process\n")
     
-    processed = 0
+    yaml_paths = []
     for file_path in file_paths:
-        file_obj = Path(file_path)
-        
-        if not file_obj.exists():
-            print(f"✗ File not found: {file_path}")
-            continue
-        
-        if not file_obj.suffix in ['.yaml', '.yml']:
+        if not file_path.endswith(('.yaml', '.yml')):
             print(f"⚠ Skipping {file_path} (not a .yaml/.yml file)")
             continue
-        
-        try:
-            if process_yaml_file(file_obj):
-                processed += 1
-        except Exception as e:
-            print(f"✗ Error processing {file_path}: {e}")
-        
-        print()
+        yaml_paths.append(file_path)
+    
+    processed = 0
+    if args.yes:
+        # No prompts, so files can be handled concurrently
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            for _, modified in executor.map(process_one, yaml_paths):
+                if modified:
+                    processed += 1
+    else:
+        # Files are reviewed one at a time, so large files spread their bodies over workers instead
+        for file_path in yaml_paths:
+            try:
+                if process_yaml_file(file_path, jobs=args.jobs):
+                    processed += 1
+            except FileNotFoundError:
+                print(f"✗ File not found: {file_path}")
+            except Exception as e:
+                print(f"✗ Error processing {file_path}: {e}")
+            
+            print()
     
     print(f"\n{'='*80}")
     print(f"Summary: {processed} file(s) modified")
@@ -190,5 +428,3 @@ def main():
 
 if __name__ == '__main__':
     main()
-
-
@@ -2,26 +2,36 @@ import json
 import llm
 import os
 import pytest
+from pathlib import Path
 from pydantic import BaseModel
 
-TINY_PNG = (
-    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\xa6\x00\x00\x01\x1a"
-    b"\x02\x03\x00\x00\x00\xe6\x99\xc4^\x00\x00\x00\tPLTE\xff\xff\xff"
-    b"\x00\xff\x00\xfe\x01\x00\x12t\x01J\x00\x00\x00GIDATx\xda\xed\xd81\x11"
-    b"\x000\x08\xc0\xc0.]\xea\xaf&Q\x89\x04V\xe0>\xf3+\xc8\x91Z\xf4\xa2\x08EQ\x14E"
-    b"Q\x14EQ\x14EQ\xd4B\x91$I3\xbb\xbf\x08EQ\x14EQ\x14EQ\x14E\xd1\xa5"
-    b"\xd4\x17\x91\xc6\x95\x05\x15\x0f\x9f\xc5\t\x9f\xa4\x00\x00\x00\x00IEND\xaeB`"
-    b"\x82"
-)
-
 PROJECT_ID = 'dummy-project'
 REGION = 'europe-west1'
 
-@pytest.mark.vcr
-def test_prompt():
+
+@pytest.fixture(scope="module")
+def model():
     model = llm.get_model("vertex-4.5-haiku")
     model.project_id = PROJECT_ID
     model.region = REGION
+    return model
+
+
+@pytest.fixture(scope="module")
+def tiny_png():
+    return (Path(__file__).parent / "fixtures" / "tiny.png").read_bytes()
+
+
+@pytest.fixture(scope="module")
+def async_model():
+    model = llm.get_async_model("vertex-4.5-haiku")
+    model.project_id = PROJECT_ID
+    model.region = REGION
+    return model
+
+
+@pytest.mark.vcr
+def test_prompt(model):
     response = model.prompt("Two names for a pet pelican, be brief")
     assert str(response) == "1. **Petro**\n2. **Captain Beak**"
     response_dict = dict(response.response_json)
@@ -41,11 +51,8 @@ def test_prompt():
 
 @pytest.mark.vcr
 @pytest.mark.asyncio
-async def test_async_prompt():
-    model = llm.get_async_model("vertex-4.5-haiku")
-    model.project_id = PROJECT_ID
-    model.region = REGION
-    conversation = model.conversation()
+async def test_async_prompt(async_model):
+    conversation = async_model.conversation()
     response = await conversation.prompt("Two names for a pet pelican, be brief")
     assert await response.text() == "1. **Pouch**\n2. **Captain**"
     response_dict = dict(response.response_json)
@@ -70,13 +77,10 @@ EXPECTED_IMAGE_TEXT = (
 
 
 @pytest.mark.vcr
-def test_image_prompt():
-    model = llm.get_model("vertex-4.5-haiku")
-    model.project_id = PROJECT_ID
-    model.region = REGION
+def test_image_prompt(model, tiny_png):
     response = model.prompt(
         "Describe image in three words",
-        attachments=[llm.Attachment(content=TINY_PNG)],
+        attachments=[llm.Attachment(content=tiny_png)],
     )
     assert str(response) == EXPECTED_IMAGE_TEXT
     response_dict = response.response_json
@@ -95,13 +99,10 @@ def test_image_prompt():
 
 
 @pytest.mark.vcr
-def test_image_with_no_prompt():
-    model = llm.get_model("vertex-4.5-haiku")
-    model.project_id = PROJECT_ID
-    model.region = REGION
+def test_image_with_no_prompt(model, tiny_png):
     response = model.prompt(
         prompt=None,
-        attachments=[llm.Attachment(content=TINY_PNG)],
+        attachments=[llm.Attachment(content=tiny_png)],
     )
     assert str(response) == (
         "# Color Analysis\n\nThis image shows two colored rectangles:\n"
@@ -119,11 +120,7 @@ class Dog(BaseModel):
 
 
 @pytest.mark.vcr
-def test_schema_prompt():
-    model = llm.get_model("vertex-4.5-haiku")
-    model.project_id = PROJECT_ID
-    model.region = REGION
-
+def test_schema_prompt(model):
     response = model.prompt("Invent a good dog", schema=Dog)
     dog = json.loads(response.text())
     assert dog == {
@@ -141,10 +138,7 @@ def test_schema_prompt():
 
 
 @pytest.mark.vcr
-def test_prompt_with_prefill_and_stop_sequences():
-    model = llm.get_model("vertex-4.5-haiku")
-    model.project_id = PROJECT_ID
-    model.region = REGION
+def test_prompt_with_prefill_and_stop_sequences(model):
     response = model.prompt(
         "Very short function describing a pelican",
         prefill="```python",
@@ -168,10 +162,7 @@ def pelican():
 
 
 @pytest.mark.vcr
-def test_thinking_prompt():
-    model = llm.get_model("vertex-4.5-haiku")
-    model.project_id = PROJECT_ID
-    model.region = REGION
+def test_thinking_prompt(model):
     conversation = model.conversation()
     response = conversation.prompt(
         "Two names for a pet pelican, be brief", thinking=True,
@@ -188,10 +179,7 @@ def test_thinking_prompt():
 
 
 @pytest.mark.vcr
-def test_tools():
-    model = llm.get_model("vertex-4.5-haiku")
-    model.project_id=PROJECT_ID
-    model.region=REGION
+def test_tools(model):
     names = ["Charles", "Sammy"]
     chain_response = model.chain(
         "Two names for a pet pelican",
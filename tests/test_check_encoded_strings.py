@@ -0,0 +1,104 @@
+import glob
+import gzip
+import importlib.util
+import json
+import yaml
+from pathlib import Path
+
+spec = importlib.util.spec_from_file_location(
+    "check_encoded_strings",
+    Path(__file__).parent.parent / "scripts" / "check_encoded_strings.py",
+)
+check_encoded_strings = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(check_encoded_strings)
+
+
+def interaction(text):
+    return {
+        "request": {"body": None, "headers": {}, "method": "POST", "uri": "https://example.com/"},
+        "response": {
+            "body": {"string": gzip.compress(text.encode("utf-8"))},
+            "headers": {
+                "Content-Encoding": ["gzip"],
+                "Content-Type": ["application/json; charset=utf-8"],
+            },
+            "status": {"code": 200, "message": "OK"},
+        },
+    }
+
+
+def make_cassette(*texts):
+    # Dumped the way VCR does, with sorted keys and !!binary bodies
+    return yaml.dump(
+        {"interactions": [interaction(text) for text in texts], "version": 1}
+    ).encode("utf-8")
+
+
+def expected(*texts):
+    data = yaml.safe_load(make_cassette(*texts))
+    for item, text in zip(data["interactions"], texts):
+        item["response"]["body"]["string"] = text
+        item["response"]["headers"].pop("Content-Encoding")
+    return data
+
+
+TEXTS = (
+    json.dumps({"access_token": "xxx", "scope": "é " * 60}, indent=2),
+    'event: message_start\ndata: {"type": "message_start"}\n\n',
+)
+
+
+def test_binary_blocks_match_yaml_round_trip():
+    raw = make_cassette(*TEXTS)
+    rewritten = check_encoded_strings.decompress_binary_blocks(raw, "cassette.yaml")
+    round_tripped = check_encoded_strings.decompress_yaml_bodies(raw, "cassette.yaml")
+    assert rewritten is not None
+    # Blank lines inside multi-line scalars must not pick up the indent
+    assert not any(line.isspace() and line != "\n" for line in rewritten.splitlines(keepends=True))
+    assert yaml.safe_load(rewritten) == yaml.safe_load(round_tripped) == expected(*TEXTS)
+
+
+def test_binary_blocks_fall_back_on_unexpected_header_layout(tmp_path, monkeypatch):
+    # Only the second response uses a flow-style header the regex does not match
+    raw = make_cassette(*TEXTS)
+    first = raw.index(b"Content-Encoding:\n")
+    second = raw.index(b"Content-Encoding:\n", first + 1)
+    head, tail = raw[:second], raw[second:]
+    tail = tail.replace(b"Content-Encoding:\n      - gzip\n", b"Content-Encoding: [gzip]\n", 1)
+    raw = head + tail
+    assert b"Content-Encoding: [gzip]" in raw
+
+    # The layout mismatch is found before any body is inflated
+    calls = []
+    decompress = check_encoded_strings.decompress_gzip_string
+    monkeypatch.setattr(
+        check_encoded_strings, "decompress_gzip_string", lambda data: calls.append(data) or decompress(data)
+    )
+    assert check_encoded_strings.decompress_binary_blocks(raw, "cassette.yaml") is None
+    assert calls == []
+    monkeypatch.undo()
+    round_tripped = check_encoded_strings.decompress_yaml_bodies(raw, "cassette.yaml")
+    assert yaml.safe_load(round_tripped) == expected(*TEXTS)
+
+    path = tmp_path / "cassette.yaml"
+    path.write_bytes(raw)
+    assert check_encoded_strings.process_yaml_file(str(path), assume_yes=True)
+    assert yaml.safe_load(path.read_text()) == expected(*TEXTS)
+
+
+def test_expand_pattern_matches_glob(tmp_path, monkeypatch):
+    root = tmp_path / "root"
+    for name in ("top.yaml", "a/nested.yaml", "a/b/deep.yaml", "a/notes.txt",
+                 "a/.hidden.yaml", ".hidden_dir/inside.yaml", "target/w.yaml"):
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).write_text("x")
+    (root / "a" / "linked.yaml").symlink_to(root / "top.yaml")
+    (root / "link").symlink_to(root / "target", target_is_directory=True)
+    monkeypatch.chdir(tmp_path)
+
+    for pattern in ("root/**/*.yaml", "root/**/.*.yaml", "**/*.yaml", "root/a/**/*.yaml",
+                    f"{root}/**/*.yaml", "root/*.yaml"):
+        assert sorted(check_encoded_strings.expand_pattern(pattern)) == sorted(
+            glob.glob(pattern, recursive=True)
+        ), pattern
+    assert "root/link/w.yaml" in check_encoded_strings.expand_pattern("root/**/*.yaml")